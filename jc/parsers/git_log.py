@@ -30,6 +30,10 @@ Usage (module):
     import jc
     result = jc.parse('git_log', git_log_command_output)
 
+    or
+
+    result = jc.parse('git_log', open('git_log_output.txt'))
+
 Schema:
 
     [
@@ -145,15 +149,28 @@ Examples:
     ]
 """
 import re
-from typing import List, Dict
+import calendar
+from functools import lru_cache
+from itertools import chain
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple, Iterator, Iterable, Union
 import jc.utils
-
-hash_pattern = re.compile(r'(?:[0-9]|[a-f]){40}')
-changes_pattern = re.compile(r'\s(?P<files>\d+)\s+(files? changed),\s+(?P<insertions>\d+)\s(insertions?\(\+\))?(,\s+)?(?P<deletions>\d+)?(\s+deletions?\(\-\))?')
+from jc.streaming import streaming_input_type_check
+
+hash_pattern = re.compile(r'[0-9a-f]{40}')
+# Thu Mar 5 09:17:40 2020 -0800
+date_pattern = re.compile(
+    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) '
+    r'(\d{1,2}) (\d{1,2}):(\d{1,2}):(\d{1,2}) (\d{4}) ([+-]\d{4})'
+)
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.2'
+    version = '1.3'
     description = '`git log` command parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -163,6 +180,42 @@ class info():
 
 __version__ = info.version
 
+# sys.platform does not change at runtime, so only check it once
+_compatible = jc.utils.is_compatible(info.compatible)
+
+
+def _timestamp(date: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Return the naive and UTC epoch timestamps for a git date string.
+
+    git dates have a fixed format (e.g. Thu Mar 5 09:17:40 2020 -0800) so
+    they are matched with a precompiled regex instead of going through the
+    format search in jc.utils.timestamp. Like jc.utils.timestamp, the naive
+    timestamp ignores the offset and the UTC timestamp is only calculated
+    for +0000. Falls back to jc.utils.timestamp for anything unexpected.
+    """
+    date_match = date_pattern.fullmatch(date)
+
+    if date_match:
+        month, day, hour, minute, second, year, offset = date_match.groups()
+        fields = (int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second))
+
+        try:
+            naive = int(datetime(*fields).timestamp())
+
+            if naive:
+                utc = None
+                if offset[1:] == '0000':
+                    utc = calendar.timegm(fields)
+
+                return naive, utc
+
+        except ValueError:
+            pass
+
+    ts = jc.utils.timestamp(date, format_hint=(1100,))
+    return ts.naive, ts.utc
+
 
 def _process(proc_data: List[Dict]) -> List[Dict]:
     """
@@ -180,9 +233,7 @@ def _process(proc_data: List[Dict]) -> List[Dict]:
 
     for entry in proc_data:
         if 'date' in entry:
-            ts = jc.utils.timestamp(entry['date'], format_hint=(1100,))
-            entry['epoch'] = ts.naive
-            entry['epoch_utc'] = ts.utc
+            entry['epoch'], entry['epoch_utc'] = _timestamp(entry['date'])
 
         if 'stats' in entry:
             for key in entry['stats']:
@@ -194,17 +245,97 @@ def _process(proc_data: List[Dict]) -> List[Dict]:
 
 def _is_commit_hash(hash_string: str) -> bool:
     # 0c55240e9da30ac4293dc324f1094de2abd3da91
-    if len(hash_string) != 40:
-        return False
+    # the length check short-circuits most lines before the regex is run
+    return len(hash_string) == 40 and hash_pattern.fullmatch(hash_string) is not None
+
+
+def _lines(data: str) -> Iterator[str]:
+    """
+    Lazily yield the lines of data without the trailing newline. This
+    avoids materializing the full list of lines with str.splitlines().
+    """
+    start = 0
+    find = data.find
+
+    while True:
+        end = find('\n', start)
+        if end == -1:
+            yield data[start:]
+            return
+
+        yield data[start:end]
+        start = end + 1
+
+
+def _emit(
+    output_line: Dict,
+    message_lines: List[str],
+    file_list: List[str]
+) -> Dict:
+    """Add the collected message lines and file names to the commit object"""
+    if message_lines:
+        output_line['message'] = '\n'.join(message_lines)
+
+    # file_list is handed over to the output, so the caller needs a new list
+    # afterwards. message_lines is joined into a new str and can be reused.
+    if file_list:
+        output_line['stats']['files'] = file_list
+
+    return output_line
+
+
+# names and emails repeat across most commits, so caching the split also
+# shares one str object per distinct author/committer in the output
+@lru_cache(maxsize=4096)
+def _split_ident(value: str) -> Tuple[str, str]:
+    # Kelly Brazil <kellyjonbrazil@gmail.com>
+    name, sep, email = value.rpartition(' <')
+    if sep and email.endswith('>'):
+        return name, email[:-1]
+
+    values = value.rsplit(maxsplit=1)
+    return values[0], values[1].strip('<').strip('>')
+
+
+def _h_commit(value: str, output_line: Dict) -> None:
+    output_line['commit'] = value
+
+
+def _h_merge(value: str, output_line: Dict) -> None:
+    output_line['merge'] = value
+
+
+def _h_author(value: str, output_line: Dict) -> None:
+    output_line['author'], output_line['author_email'] = _split_ident(value)
 
-    if hash_pattern.match(hash_string):
-        return True
 
-    return False
+def _h_date(value: str, output_line: Dict) -> None:
+    output_line['date'] = value
+
+
+def _h_commitdate(value: str, output_line: Dict) -> None:
+    output_line['commit_by_date'] = value
+
+
+def _h_commit_by(value: str, output_line: Dict) -> None:
+    output_line['commit_by'], output_line['commit_by_email'] = _split_ident(value)
+
+
+# header lines are dispatched on their first token with a single dict lookup
+# instead of a chain of str.startswith() calls
+HANDLERS = {
+    'commit': _h_commit,
+    'Merge:': _h_merge,
+    'Author:': _h_author,
+    'Date:': _h_date,
+    'AuthorDate:': _h_date,
+    'CommitDate:': _h_commitdate,
+    'Commit:': _h_commit_by
+}
 
 
 def parse(
-    data: str,
+    data: Union[str, Iterable[str]],
     raw: bool = False,
     quiet: bool = False
 ) -> List[Dict]:
@@ -213,7 +344,8 @@ def parse(
 
     Parameters:
 
-        data:        (string)  text data to parse
+        data:        (string or iterable) text data to parse. Can also
+                     be an iterable of lines (e.g. an open file object)
         raw:         (boolean) unprocessed output if True
         quiet:       (boolean) suppress warning messages if True
 
@@ -221,110 +353,100 @@ def parse(
 
         List of Dictionaries. Raw or processed structured data.
     """
-    jc.utils.compatibility(__name__, info.compatible, quiet)
-    jc.utils.input_type_check(data)
+    if not _compatible:
+        jc.utils.compatibility(__name__, info.compatible, quiet)
 
     raw_output: List = []
     output_line: Dict = {}
     message_lines: List[str] = []
     file_list: List[str] = []
-
-    if jc.utils.has_data(data):
-
-        for line in data.splitlines():
-            line_list = line.split(maxsplit=1)
-
-            # oneline style
-            if not line.startswith(' ') and line_list and _is_commit_hash(line_list[0]):
-                if output_line:
-                    if file_list:
-                        output_line['stats']['files'] = file_list
-
-                    raw_output.append(output_line)
-                    output_line = {}
-                    message_lines = []
-                    file_list = []
-                output_line = {
-                    'commit': line_list[0],
-                    'message': line_list[1]
-                }
-                continue
-
-            # all other styles
-            if line.startswith('commit '):
-                if output_line:
-                    if message_lines:
-                        output_line['message'] = '\n'.join(message_lines)
-
-                    if file_list:
-                        output_line['stats']['files'] = file_list
-
-                    raw_output.append(output_line)
-                    output_line = {}
-                    message_lines = []
-                    file_list = []
-                output_line['commit'] = line_list[1]
-                continue
-
-            if line.startswith('Merge: '):
-                output_line['merge'] = line_list[1]
-                continue
-
-            if line.startswith('Author: '):
-                values = line_list[1].rsplit(maxsplit=1)
-                output_line['author'] = values[0]
-                output_line['author_email'] = values[1].strip('<').strip('>')
-                continue
-
-            if line.startswith('Date: '):
-                output_line['date'] = line_list[1]
-                continue
-
-            if line.startswith('AuthorDate: '):
-                output_line['date'] = line_list[1]
-                continue
-
-            if line.startswith('CommitDate: '):
-                output_line['commit_by_date'] = line_list[1]
-                continue
-
-            if line.startswith('Commit: '):
-                values = line_list[1].rsplit(maxsplit=1)
-                output_line['commit_by'] = values[0]
-                output_line['commit_by_email'] = values[1].strip('<').strip('>')
-                continue
-
+    lines: Iterable[str]
+
+    if isinstance(data, str):
+        lines = _lines(data) if jc.utils.has_data(data) else ()
+    else:
+        streaming_input_type_check(data)
+        lines = (line.rstrip('\r\n') for line in data)
+
+    # fast path for `--oneline` output where every line is '<hash> <message>'.
+    # On the first line that is not, the last commit becomes the current
+    # output_line and the remaining lines go through the general loop below.
+    lines = iter(lines)
+    for line in lines:
+        if not line:
+            continue
+
+        head, _, rest = line.partition(' ')
+        if not _is_commit_hash(head):
+            if raw_output:
+                output_line = raw_output.pop()
+            lines = chain((line,), lines)
+            break
+
+        raw_output.append({
+            'commit': head,
+            'message': rest.strip()
+        })
+
+    # bind the hot-loop dispatch lookup to a local
+    get_handler = HANDLERS.get
+
+    # header lines are the most common in real logs, so blank and indented
+    # lines are ruled out with cheap checks before the header dispatch
+    for line in lines:
+        if not line:
+            continue
+
+        # indented lines are message, file name, or stat summary lines
+        if line[:1] == ' ':
             if line.startswith('    '):
                 message_lines.append(line.strip())
                 continue
 
-            if line.startswith(' ') and 'changed, ' not in line:
+            if 'changed, ' not in line:
                 # this is a file name
-                file_name = line.split('|')[0].strip()
+                file_name = line.partition('|')[0].strip()
                 file_list.append(file_name)
                 continue
 
-            if line.startswith(' ') and 'changed, ' in line:
-                # this is the stat summary
-                changes = changes_pattern.match(line)
-                if changes:
-                    files = changes['files']
-                    insertions = changes['insertions']
-                    deletions = changes['deletions']
-
-                output_line['stats'] = {
-                    'files_changed': files or '0',
-                    'insertions': insertions or '0',
-                    'deletions':  deletions or '0'
-                }
+            # this is the stat summary
+            #  2 files changed, 90 insertions(+), 12 deletions(-)
+            changes = line.split(',')
+            output_line['stats'] = {
+                'files_changed': changes[0].split()[0],
+                'insertions': changes[1].split()[0],
+                'deletions': changes[2].split()[0] if len(changes) > 2 else '0'
+            }
+            continue
+
+        head, _, rest = line.partition(' ')
+        handler = get_handler(head)
+
+        if handler:
+            if handler is _h_commit and output_line:
+                raw_output.append(_emit(output_line, message_lines, file_list))
+                output_line = {}
+                message_lines.clear()
+                if file_list:
+                    file_list = []
 
-    if output_line:
-        if message_lines:
-            output_line['message'] = '\n'.join(message_lines)
+            handler(rest.strip(), output_line)
+            continue
 
-        if file_list:
-            output_line['stats']['files'] = file_list
+        # oneline style
+        if _is_commit_hash(head):
+            if output_line:
+                raw_output.append(_emit(output_line, message_lines, file_list))
+                output_line = {}
+                message_lines.clear()
+                if file_list:
+                    file_list = []
+            output_line = {
+                'commit': head,
+                'message': rest.strip()
+            }
 
-        raw_output.append(output_line)
+    if output_line:
+        raw_output.append(_emit(output_line, message_lines, file_list))
 
     return raw_output if raw else _process(raw_output)
@@ -73,7 +73,10 @@ Examples:
     ...
 """
 import re
-from typing import List, Dict, Iterable, Union
+import calendar
+from functools import lru_cache
+from datetime import datetime
+from typing import List, Dict, Optional, Tuple, Iterable, Union
 import jc.utils
 from jc.streaming import (
     add_jc_meta, streaming_input_type_check, streaming_line_input_type_check, raise_or_yield
@@ -81,13 +84,21 @@ from jc.streaming import (
 from jc.exceptions import ParseError
 
 
-hash_pattern = re.compile(r'(?:[0-9]|[a-f]){40}')
-changes_pattern = re.compile(r'\s(?P<files>\d+)\s+(files? changed),\s+(?P<insertions>\d+)\s(insertions?\(\+\))?(,\s+)?(?P<deletions>\d+)?(\s+deletions?\(\-\))?')
+hash_pattern = re.compile(r'[0-9a-f]{40}')
+# Thu Mar 5 09:17:40 2020 -0800
+date_pattern = re.compile(
+    r'(?:Mon|Tue|Wed|Thu|Fri|Sat|Sun) (Jan|Feb|Mar|Apr|May|Jun|Jul|Aug|Sep|Oct|Nov|Dec) '
+    r'(\d{1,2}) (\d{1,2}):(\d{1,2}):(\d{1,2}) (\d{4}) ([+-]\d{4})'
+)
+_MONTHS = {
+    'Jan': 1, 'Feb': 2, 'Mar': 3, 'Apr': 4, 'May': 5, 'Jun': 6,
+    'Jul': 7, 'Aug': 8, 'Sep': 9, 'Oct': 10, 'Nov': 11, 'Dec': 12
+}
 
 
 class info():
     """Provides parser metadata (version, author, etc.)"""
-    version = '1.2'
+    version = '1.3'
     description = '`git log` command streaming parser'
     author = 'Kelly Brazil'
     author_email = 'kellyjonbrazil@gmail.com'
@@ -98,6 +109,39 @@ class info():
 __version__ = info.version
 
 
+def _timestamp(date: str) -> Tuple[Optional[int], Optional[int]]:
+    """
+    Return the naive and UTC epoch timestamps for a git date string.
+
+    git dates have a fixed format (e.g. Thu Mar 5 09:17:40 2020 -0800) so
+    they are matched with a precompiled regex instead of going through the
+    format search in jc.utils.timestamp. Like jc.utils.timestamp, the naive
+    timestamp ignores the offset and the UTC timestamp is only calculated
+    for +0000. Falls back to jc.utils.timestamp for anything unexpected.
+    """
+    date_match = date_pattern.fullmatch(date)
+
+    if date_match:
+        month, day, hour, minute, second, year, offset = date_match.groups()
+        fields = (int(year), _MONTHS[month], int(day), int(hour), int(minute), int(second))
+
+        try:
+            naive = int(datetime(*fields).timestamp())
+
+            if naive:
+                utc = None
+                if offset[1:] == '0000':
+                    utc = calendar.timegm(fields)
+
+                return naive, utc
+
+        except ValueError:
+            pass
+
+    ts = jc.utils.timestamp(date, format_hint=(1100,))
+    return ts.naive, ts.utc
+
+
 def _process(proc_data: Dict) -> Dict:
     """
     Final processing to conform to the schema.
@@ -113,9 +157,7 @@ def _process(proc_data: Dict) -> Dict:
     int_list = {'files_changed', 'insertions', 'deletions'}
 
     if 'date' in proc_data:
-        ts = jc.utils.timestamp(proc_data['date'], format_hint=(1100,))
-        proc_data['epoch'] = ts.naive
-        proc_data['epoch_utc'] = ts.utc
+        proc_data['epoch'], proc_data['epoch_utc'] = _timestamp(proc_data['date'])
 
     if 'stats' in proc_data:
         for key in proc_data['stats']:
@@ -127,13 +169,75 @@ def _process(proc_data: Dict) -> Dict:
 
 def _is_commit_hash(hash_string: str) -> bool:
     # 0c55240e9da30ac4293dc324f1094de2abd3da91
-    if len(hash_string) != 40:
-        return False
+    # the length check short-circuits most lines before the regex is run
+    return len(hash_string) == 40 and hash_pattern.fullmatch(hash_string) is not None
+
+
+def _emit(
+    output_line: Dict,
+    message_lines: List[str],
+    file_list: List[str]
+) -> Dict:
+    """Add the collected message lines and file names to the commit object"""
+    if message_lines:
+        output_line['message'] = '\n'.join(message_lines)
+
+    # file_list is handed over to the output, so the caller needs a new list
+    # afterwards. message_lines is joined into a new str and can be reused.
+    if file_list:
+        output_line['stats']['files'] = file_list
+
+    return output_line
+
 
-    if hash_pattern.match(hash_string):
-        return True
+# names and emails repeat across most commits, so caching the split also
+# shares one str object per distinct author/committer in the output
+@lru_cache(maxsize=4096)
+def _split_ident(value: str) -> Tuple[str, str]:
+    # Kelly Brazil <kellyjonbrazil@gmail.com>
+    name, sep, email = value.rpartition(' <')
+    if sep and email.endswith('>'):
+        return name, email[:-1]
 
-    return False
+    values = value.rsplit(maxsplit=1)
+    return values[0], values[1].strip('<').strip('>')
+
+
+def _h_commit(value: str, output_line: Dict) -> None:
+    output_line['commit'] = value
+
+
+def _h_merge(value: str, output_line: Dict) -> None:
+    output_line['merge'] = value
+
+
+def _h_author(value: str, output_line: Dict) -> None:
+    output_line['author'], output_line['author_email'] = _split_ident(value)
+
+
+def _h_date(value: str, output_line: Dict) -> None:
+    output_line['date'] = value
+
+
+def _h_commitdate(value: str, output_line: Dict) -> None:
+    output_line['commit_by_date'] = value
+
+
+def _h_commit_by(value: str, output_line: Dict) -> None:
+    output_line['commit_by'], output_line['commit_by_email'] = _split_ident(value)
+
+
+# header lines are dispatched on their first token with a single dict lookup
+# instead of a chain of str.startswith() calls
+HANDLERS = {
+    'commit': _h_commit,
+    'Merge:': _h_merge,
+    'Author:': _h_author,
+    'Date:': _h_date,
+    'AuthorDate:': _h_date,
+    'CommitDate:': _h_commitdate,
+    'Commit:': _h_commit_by
+}
 
 
 @add_jc_meta
@@ -167,6 +271,9 @@ def parse(
     message_lines: List[str] = []
     file_list: List[str] = []
 
+    # bind the hot-loop dispatch lookup to a local
+    get_handler = HANDLERS.get
+
     for line in data:
         try:
             streaming_line_input_type_check(line)
@@ -174,92 +281,57 @@ def parse(
             if line == '' or line == '\n':
                 continue
 
-            line_list = line.rstrip().split(maxsplit=1)
+            # indented lines are message, file name, or stat summary lines
+            if line[:1] == ' ':
+                if line.startswith('    '):
+                    message_lines.append(line.strip())
+                    continue
 
-            # oneline style
-            if not line.startswith(' ') and line_list and _is_commit_hash(line_list[0]):
-                if output_line:
-                    if file_list:
-                        output_line['stats']['files'] = file_list
+                if 'changed, ' not in line:
+                    # this is a file name
+                    file_name = line.partition('|')[0].strip()
+                    file_list.append(file_name)
+                    continue
 
-                    yield output_line if raw else _process(output_line)
-
-                    output_line = {}
-                    message_lines = []
-                    file_list = []
-                output_line = {
-                    'commit': line_list[0],
-                    'message': line_list[1]
+                # this is the stat summary
+                #  2 files changed, 90 insertions(+), 12 deletions(-)
+                changes = line.split(',')
+                output_line['stats'] = {
+                    'files_changed': changes[0].split()[0],
+                    'insertions': changes[1].split()[0],
+                    'deletions': changes[2].split()[0] if len(changes) > 2 else '0'
                 }
                 continue
 
-            # all other styles
-            if line.startswith('commit '):
-                if output_line:
-                    if message_lines:
-                        output_line['message'] = '\n'.join(message_lines)
-
-                    if file_list:
-                        output_line['stats']['files'] = file_list
+            head, _, rest = line.partition(' ')
+            handler = get_handler(head)
 
+            if handler:
+                if handler is _h_commit and output_line:
+                    output_line = _emit(output_line, message_lines, file_list)
                     yield output_line if raw else _process(output_line)
 
                     output_line = {}
-                    message_lines = []
-                    file_list = []
-                output_line['commit'] = line_list[1]
-                continue
-
-            if line.startswith('Merge: '):
-                output_line['merge'] = line_list[1]
-                continue
-
-            if line.startswith('Author: '):
-                values = line_list[1].rsplit(maxsplit=1)
-                output_line['author'] = values[0]
-                output_line['author_email'] = values[1].strip('<').strip('>')
-                continue
-
-            if line.startswith('Date: '):
-                output_line['date'] = line_list[1]
-                continue
-
-            if line.startswith('AuthorDate: '):
-                output_line['date'] = line_list[1]
-                continue
-
-            if line.startswith('CommitDate: '):
-                output_line['commit_by_date'] = line_list[1]
-                continue
-
-            if line.startswith('Commit: '):
-                values = line_list[1].rsplit(maxsplit=1)
-                output_line['commit_by'] = values[0]
-                output_line['commit_by_email'] = values[1].strip('<').strip('>')
-                continue
-
-            if line.startswith('    '):
-                message_lines.append(line.strip())
-                continue
+                    message_lines.clear()
+                    if file_list:
+                        file_list = []
 
-            if line.startswith(' ') and 'changed, ' not in line:
-                # this is a file name
-                file_name = line.split('|')[0].strip()
-                file_list.append(file_name)
+                handler(rest.strip(), output_line)
                 continue
 
-            if line.startswith(' ') and 'changed, ' in line:
-                # this is the stat summary
-                changes = changes_pattern.match(line)
-                if changes:
-                    files = changes['files']
-                    insertions = changes['insertions']
-                    deletions = changes['deletions']
+            # oneline style
+            if _is_commit_hash(head):
+                if output_line:
+                    output_line = _emit(output_line, message_lines, file_list)
+                    yield output_line if raw else _process(output_line)
 
-                output_line['stats'] = {
-                    'files_changed': files or '0',
-                    'insertions': insertions or '0',
-                    'deletions':  deletions or '0'
+                    output_line = {}
+                    message_lines.clear()
+                    if file_list:
+                        file_list = []
+                output_line = {
+                    'commit': head,
+                    'message': rest.strip()
                 }
                 continue
 
@@ -270,12 +342,7 @@ def parse(
 
     try:
         if output_line:
-            if message_lines:
-                output_line['message'] = '\n'.join(message_lines)
-
-            if file_list:
-                output_line['stats']['files'] = file_list
-
+            output_line = _emit(output_line, message_lines, file_list)
             yield output_line if raw else _process(output_line)
 
     except Exception as e:
@@ -236,6 +236,25 @@ class MyTests(unittest.TestCase):
         """
         self.assertEqual(jc.parsers.git_log.parse(self.git_log_fuller_is_hash_regex_fix, quiet=True), self.git_log_fuller_is_hash_regex_fix_json)
 
+    def test_git_log_fuller_stat_iterable(self):
+        """
+        Test 'git_log --format=fuller --stat' with an iterable of lines
+        as input
+        """
+        self.assertEqual(jc.parsers.git_log.parse(self.git_log_fuller_stat.splitlines(keepends=True), quiet=True), self.git_log_fuller_stat_json)
+
+    def test_git_log_iterable_nodata(self):
+        """
+        Test 'git_log' with an empty iterable of lines as input
+        """
+        self.assertEqual(jc.parsers.git_log.parse([], quiet=True), [])
+
+    def test_git_log_bytes(self):
+        """
+        Test 'git_log' with bytes input
+        """
+        self.assertRaises(TypeError, jc.parsers.git_log.parse, b'commit 123', quiet=True)
+
 
 if __name__ == '__main__':
     unittest.main()